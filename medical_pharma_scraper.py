@@ -11,15 +11,50 @@ Author: Business Development Scraper
 Date: September 2025
 """
 
+import asyncio
+try:
+    import aiohttp
+except ImportError:  # optional - the thread-pool fallback below uses requests only
+    aiohttp = None
+try:
+    import aiodns
+except ImportError:  # optional - aiohttp falls back to threaded DNS lookups
+    aiodns = None
+try:
+    import brotli  # noqa: F401 - lets requests/aiohttp decode 'br' responses
+    _BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _BROTLI_AVAILABLE = True
+    except ImportError:
+        _BROTLI_AVAILABLE = False
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional - event pages fall back to BeautifulSoup below
+    HTMLParser = None
+from concurrent.futures import ThreadPoolExecutor
 import csv
-import pandas as pd
+import functools
+import os
 import re
-from urllib.parse import urljoin
+import threading
 import time
+from collections import defaultdict
+from urllib.parse import urljoin, urlsplit, urlunsplit
 from datetime import datetime
 import json
+try:
+    import orjson
+    _json_loads = orjson.loads  # ~3x faster than stdlib, takes bytes directly
+except ImportError:  # optional - stdlib json works the same here
+    _json_loads = json.loads
 
 # ==========================================
 # 🎛️ CONFIGURATION PANEL - CHANGE HERE!
@@ -31,11 +66,29 @@ EVENTS_TO_SCRAPE = 10  # 👈 CHANGE THIS NUMBER (5, 10, 20, 50, 100)
 # 🌍 VPN/LOCATION SETTINGS
 USE_STEALTH_MODE = True  # Enhanced headers to avoid blocking
 REQUEST_DELAY = 2  # Seconds between requests (increase if getting blocked)
+CONCURRENT_REQUESTS = 8  # Event pages fetched in parallel (lower if getting blocked)
+MAX_PAGE_BYTES = 512_000  # Stop reading a page after this many bytes (organizer info is near the top)
 
 # 📁 OUTPUT FILES
 OUTPUT_CSV = "verified_event_organizers.csv"
 VALIDATION_LOG = "data_validation_log.txt"
 
+# 🔎 Precompiled patterns - compiled once at import instead of per event
+_ORG_KEYWORD_RE = re.compile(r'organizer|organised by|organiser|hosted by|presented by', re.IGNORECASE)
+_EMAIL_RE_BYTES = re.compile(rb'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_EMAIL_VALIDATE_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_ONCLICK_URL_RE = re.compile(r"window\.open\(['\"]([^'\"]+)['\"]")
+_CONTACT_RE = re.compile(r'contact|about|organizer', re.IGNORECASE)
+_JSON_LD_RE = re.compile(rb'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+
+# 🧭 Compiled XPaths for the listing page - each one is a single C-level
+# traversal per event card instead of several Python-level find() calls
+_XP_EVENT_CARDS = etree.XPath('//tr[contains(@class, "event-card")]')
+_XP_CARD_DATE = etree.XPath('.//td[contains(@class, "text-dark")]')
+_XP_CARD_ONCLICK = etree.XPath('.//td[@onclick]/@onclick')
+_XP_CARD_VENUE = etree.XPath('.//div[contains(@class, "venue")]')
+_XP_CARD_VENUE_LINK = etree.XPath('.//div[contains(@class, "venue")]//a')
+
 # ==========================================
 # 🔧 SCRAPING FUNCTIONS
 # ==========================================
@@ -46,7 +99,9 @@ def get_stealth_headers():
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
+        # Only advertise Brotli when we can actually decode it, otherwise
+        # servers may send 'br' bodies the client can't handle
+        'Accept-Encoding': 'gzip, deflate, br' if _BROTLI_AVAILABLE else 'gzip, deflate',
         'DNT': '1',
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
@@ -58,124 +113,390 @@ def get_stealth_headers():
         'Referer': 'https://google.com'
     }
 
-def validate_url(url):
-    """Check if a URL is reachable and valid"""
+# 🌐 Shared session: reuses keep-alive connections instead of opening a
+# fresh TCP+TLS connection for every single request
+SESSION = requests.Session()
+SESSION.headers.update(get_stealth_headers())
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'HEAD']
+    )
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+def _normalize_url(url):
+    """Normalize a URL (drop fragment, lower-case host) so duplicates share one cache entry"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ''))
+
+@functools.lru_cache(maxsize=4096)
+def _validate_url_cached(url):
     try:
-        response = requests.head(url, headers=get_stealth_headers(), timeout=10)
+        response = SESSION.head(url, timeout=10, allow_redirects=False)
         return response.status_code in [200, 301, 302]
-    except:
+    except requests.RequestException:
         return False
 
+def validate_url(url):
+    """Check if a URL is reachable and valid (fallback when no GET was issued yet)"""
+    return _validate_url_cached(_normalize_url(url))
+
+class HostLimiter:
+    """
+    Per-host rate limiter: requests to different organizer domains run in
+    parallel, while each single host is held to `rps` requests per second.
+    Safe to share between the asyncio path and worker threads.
+    """
+
+    def __init__(self, rps):
+        self.min_interval = 1.0 / rps
+        self.next_slot = defaultdict(float)
+        self.lock = threading.Lock()
+
+    def _reserve(self, host):
+        """Claim the next request slot for this host; returns how long to wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot[host], now)
+            self.next_slot[host] = slot + self.min_interval
+            return slot - now
+
+    def wait(self, host):
+        delay = self._reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, host):
+        delay = self._reserve(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+# One request per REQUEST_DELAY seconds per host, shared by all workers
+HOST_LIMITER = HostLimiter(rps=1.0 / REQUEST_DELAY)
+
+# 💾 In-memory page cache: organizers often share domains, so the same
+# contact/event page can be requested several times per run
+_PAGE_CACHE = {}
+_PAGE_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+async def _fetch_bytes(url, session):
+    """Fetch a page once per normalized URL; repeat fetches are served from memory"""
+    key = _normalize_url(url)
+    if key in _PAGE_CACHE:
+        _PAGE_CACHE_STATS['hits'] += 1
+        return _PAGE_CACHE[key]
+    _PAGE_CACHE_STATS['misses'] += 1
+    await HOST_LIMITER.wait_async(urlsplit(url).netloc)
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+        response.raise_for_status()
+        # Stream with a size cap so a huge marketing page can't blow up
+        # memory or the soup-parse cost
+        chunks = []
+        total = 0
+        async for chunk in response.content.iter_chunked(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > MAX_PAGE_BYTES:
+                break
+        body = b''.join(chunks)
+    _PAGE_CACHE[key] = body
+    return body
+
+def _fetch_bytes_sync(url):
+    """requests.Session twin of _fetch_bytes, for the thread-pool path"""
+    key = _normalize_url(url)
+    if key in _PAGE_CACHE:
+        _PAGE_CACHE_STATS['hits'] += 1
+        return _PAGE_CACHE[key]
+    _PAGE_CACHE_STATS['misses'] += 1
+    HOST_LIMITER.wait(urlsplit(url).netloc)
+    response = SESSION.get(url, timeout=15, stream=True)
+    try:
+        response.raise_for_status()
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > MAX_PAGE_BYTES:
+                break
+        body = b''.join(chunks)
+    finally:
+        response.close()
+    _PAGE_CACHE[key] = body
+    return body
+
 def validate_email_format(email):
     """Basic email format validation"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_VALIDATE_RE.match(email) is not None
 
-def extract_organizer_details(event_url, headers):
+def _organizer_from_json_ld(body):
     """
-    Extract organizer information from individual event pages
+    Method 0: pull the organizer straight out of embedded JSON-LD Event
+    objects (10times embeds these). One JSON parse replaces the heuristic
+    tree scanning and the extra contact-page request. Returns the organizer
+    dict or None.
+    """
+    for raw in _JSON_LD_RE.findall(body):
+        try:
+            data = _json_loads(raw)
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict) or 'Event' not in str(item.get('@type', '')):
+                continue
+            organizer = item.get('organizer')
+            if isinstance(organizer, list) and organizer:
+                organizer = organizer[0]
+            if isinstance(organizer, dict) and (organizer.get('name') or organizer.get('url')):
+                return organizer
+    return None
+
+def _find_organizer_link_selectolax(tree):
+    """Method 1 (selectolax): first link near an organizer keyword mention, or None"""
+    if tree.root is None:
+        return None
+    sections = []
+    for node in tree.root.traverse(include_text=True):
+        if node.tag == '-text' and _ORG_KEYWORD_RE.search(node.text(deep=False) or ''):
+            sections.append(node)
+            if len(sections) == 2:  # Check first 2 matches
+                break
+    for section in sections:
+        parent = section.parent
+        if parent:
+            # Look for links near organizer mentions
+            sibling = parent.next
+            checked = 0
+            while sibling is not None and checked < 3:
+                if sibling.tag == '-text':
+                    sibling = sibling.next
+                    continue
+                checked += 1
+                link = sibling.css_first('a[href]')
+                if link:
+                    href = link.attributes.get('href') or ''
+                    if not href.startswith('mailto:') and 'http' in href:
+                        return href, link.text(strip=True)
+                sibling = sibling.next
+    return None
+
+def _find_organizer_link_bs4(soup):
+    """Method 1 (BeautifulSoup fallback): first link near an organizer keyword mention, or None"""
+    sections = soup.find_all(string=_ORG_KEYWORD_RE)
+    for section in sections[:2]:  # Check first 2 matches
+        parent = section.parent
+        if parent:
+            # Look for links near organizer mentions
+            next_elements = parent.find_next_siblings()[:3]
+            for element in next_elements:
+                link = element.find('a')
+                if link and link.get('href'):
+                    href = link.get('href')
+                    if not href.startswith('mailto:') and 'http' in href:
+                        return href, link.get_text(strip=True)
+    return None
+
+def _parse_organizer_page(body, event_url):
+    """
+    Run the heuristic extraction methods over a fetched event page.
+
+    Pure parsing - returns the partially-filled organizer info plus the
+    candidate contact-page URLs for Method 3, whose fetches the async and
+    thread-pool callers perform with their own HTTP client.
+
+    Event pages are parsed with selectolax (C-level Modest engine) when it
+    is installed, falling back to BeautifulSoup otherwise.
     """
     organizer_info = {
         'organiser_name': 'N/A',
-        'organiser_website': 'N/A', 
+        'organiser_website': 'N/A',
         'organiser_email': 'N/A',
         'contact_person': 'N/A',
         'verification_status': 'Unverified'
     }
-    
-    try:
-        print(f"    🔍 Extracting organizer details from: {event_url[:60]}...")
-        
-        response = requests.get(event_url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Method 1: Look for organizer sections
-        organizer_keywords = ['organizer', 'organised by', 'organiser', 'hosted by', 'presented by']
-        for keyword in organizer_keywords:
-            sections = soup.find_all(text=re.compile(keyword, re.IGNORECASE))
-            for section in sections[:2]:  # Check first 2 matches
-                parent = section.parent
-                if parent:
-                    # Look for links near organizer mentions
-                    next_elements = parent.find_next_siblings()[:3]
-                    for element in next_elements:
-                        link = element.find('a')
-                        if link and link.get('href'):
-                            href = link.get('href')
-                            if not href.startswith('mailto:') and 'http' in href:
-                                organizer_info['organiser_website'] = href
-                                organizer_info['organiser_name'] = link.get_text(strip=True) or href.split('//')[1].split('/')[0]
-                                organizer_info['verification_status'] = 'Website_Found'
-                                break
-        
-        # Method 2: Look for email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, str(soup))
-        
-        if emails:
-            # Filter out common non-organizer emails
-            filtered_emails = [e for e in emails if not any(x in e.lower() for x in ['facebook', 'twitter', 'linkedin', 'google', 'youtube'])]
-            if filtered_emails:
-                organizer_info['organiser_email'] = filtered_emails[0]
-                organizer_info['verification_status'] = 'Email_Found'
-        
-        # Method 3: Look for contact pages or about pages
-        contact_links = soup.find_all('a', text=re.compile(r'contact|about|organizer', re.IGNORECASE))
+    contact_candidates = []
+
+    # Method 0: structured data first - when the page ships its organizer in
+    # JSON-LD there's nothing to guess and no contact page to verify
+    organizer = _organizer_from_json_ld(body)
+    if organizer:
+        organizer_info['organiser_name'] = organizer.get('name') or 'N/A'
+        organizer_info['organiser_website'] = organizer.get('url') or 'N/A'
+        organizer_info['organiser_email'] = organizer.get('email') or 'N/A'
+        organizer_info['verification_status'] = 'Structured_Data_Found'
+        return organizer_info, contact_candidates
+
+    if HTMLParser is not None:
+        tree = HTMLParser(body)
+
+        # Method 1: Look for organizer sections - stop at the first hit
+        found = _find_organizer_link_selectolax(tree)
+
+        # Method 3 candidates: contact or about pages, verified by the caller
+        for link in tree.css('a[href]'):
+            if _CONTACT_RE.search(link.text(strip=True) or ''):
+                href = link.attributes.get('href') or ''
+                if href and not href.startswith('mailto:'):
+                    contact_candidates.append(urljoin(event_url, href))
+                    if len(contact_candidates) == 2:
+                        break
+
+    else:
+        soup = BeautifulSoup(body, 'lxml')
+
+        # Method 1: Look for organizer sections - stop at the first hit
+        found = _find_organizer_link_bs4(soup)
+
+        # Method 3 candidates: contact or about pages, verified by the caller
+        contact_links = soup.find_all('a', string=_CONTACT_RE)
         for link in contact_links[:2]:
             href = link.get('href')
             if href and not href.startswith('mailto:'):
-                full_url = urljoin(event_url, href)
-                if validate_url(full_url):
-                    organizer_info['organiser_website'] = full_url
-                    organizer_info['verification_status'] = 'Contact_Page_Found'
-                    break
-        
-        time.sleep(REQUEST_DELAY)
-        
+                contact_candidates.append(urljoin(event_url, href))
+
+    if found:
+        href, link_text = found
+        organizer_info['organiser_website'] = href
+        organizer_info['organiser_name'] = link_text or href.split('//')[1].split('/')[0]
+        organizer_info['verification_status'] = 'Website_Found'
+
+    # Method 2: Look for email addresses in the raw bytes - no need to
+    # serialize any parsed tree just to regex-scan it
+    emails = [m.decode('ascii', 'ignore') for m in _EMAIL_RE_BYTES.findall(body)]
+    emails = list(dict.fromkeys(emails))  # dedupe, keep first-seen order
+
+    if emails:
+        # Filter out common non-organizer emails
+        filtered_emails = [e for e in emails if not any(x in e.lower() for x in ['facebook', 'twitter', 'linkedin', 'google', 'youtube'])]
+        if filtered_emails:
+            organizer_info['organiser_email'] = filtered_emails[0]
+            organizer_info['verification_status'] = 'Email_Found'
+
+    return organizer_info, contact_candidates
+
+async def extract_organizer_details(event_url, session):
+    """
+    Extract organizer information from individual event pages
+    """
+    organizer_info = {
+        'organiser_name': 'N/A',
+        'organiser_website': 'N/A',
+        'organiser_email': 'N/A',
+        'contact_person': 'N/A',
+        'verification_status': 'Unverified'
+    }
+
+    try:
+        print(f"    🔍 Extracting organizer details from: {event_url[:60]}...")
+
+        body = await _fetch_bytes(event_url, session)
+        organizer_info, contact_candidates = _parse_organizer_page(body, event_url)
+
+        # Method 3: first reachable contact page wins; the fetch result is
+        # remembered so the caller doesn't need a second validation round-trip
+        for full_url in contact_candidates:
+            try:
+                await _fetch_bytes(full_url, session)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                continue
+            organizer_info['organiser_website'] = full_url
+            organizer_info['_website_http_ok'] = True
+            organizer_info['verification_status'] = 'Contact_Page_Found'
+            break
+
+    except aiohttp.ClientResponseError as e:
+        # A definitive HTTP status (e.g. 404) - retrying won't help
+        print(f"      ❌ Event page returned HTTP {e.status}: {event_url[:60]}")
+        organizer_info['verification_status'] = f'HTTP_{e.status}'
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"      ❌ Network error extracting organizer details: {str(e)}")
+        organizer_info['verification_status'] = 'Network_Error'
     except Exception as e:
         print(f"      ❌ Error extracting organizer details: {str(e)}")
         organizer_info['verification_status'] = f'Error: {str(e)[:50]}'
-    
+
+    return organizer_info
+
+def extract_organizer_details_sync(event_url):
+    """Thread-pool fallback for extract_organizer_details, used when aiohttp is not installed"""
+    organizer_info = {
+        'organiser_name': 'N/A',
+        'organiser_website': 'N/A',
+        'organiser_email': 'N/A',
+        'contact_person': 'N/A',
+        'verification_status': 'Unverified'
+    }
+
+    try:
+        print(f"    🔍 Extracting organizer details from: {event_url[:60]}...")
+
+        body = _fetch_bytes_sync(event_url)
+        organizer_info, contact_candidates = _parse_organizer_page(body, event_url)
+
+        for full_url in contact_candidates:
+            try:
+                _fetch_bytes_sync(full_url)
+            except requests.RequestException:
+                continue
+            organizer_info['organiser_website'] = full_url
+            organizer_info['_website_http_ok'] = True
+            organizer_info['verification_status'] = 'Contact_Page_Found'
+            break
+
+    except requests.HTTPError as e:
+        # A definitive HTTP status (e.g. 404) - the Session already retried
+        # the transient 429/5xx cases, so don't dress this up as transient
+        status = e.response.status_code if e.response is not None else 'error'
+        print(f"      ❌ Event page returned HTTP {status}: {event_url[:60]}")
+        organizer_info['verification_status'] = f'HTTP_{status}'
+    except (requests.Timeout, requests.ConnectionError) as e:
+        print(f"      ❌ Network error extracting organizer details: {str(e)}")
+        organizer_info['verification_status'] = 'Network_Error'
+    except Exception as e:
+        print(f"      ❌ Error extracting organizer details: {str(e)}")
+        organizer_info['verification_status'] = f'Error: {str(e)[:50]}'
+
     return organizer_info
 
 def extract_event_data_from_card(card, headers):
-    """Extract event data from 10times.com event card"""
+    """Extract event data from a 10times.com event card (lxml element)"""
     event_data = {}
-    
+
     try:
         # Extract event date
-        date_td = card.find('td', class_='text-dark')
-        if date_td:
-            event_data['event_date'] = date_td.get_text(strip=True)
+        date_tds = _XP_CARD_DATE(card)
+        if date_tds:
+            event_data['event_date'] = date_tds[0].text_content().strip()
         else:
             event_data['event_date'] = 'N/A'
-        
+
         # Extract event link and name
-        clickable_td = card.find('td', {'onclick': True})
-        if clickable_td:
-            onclick_content = clickable_td.get('onclick', '')
-            url_match = re.search(r"window\.open\(['\"]([^'\"]+)['\"]", onclick_content)
-            if url_match:
-                event_data['event_link'] = url_match.group(1)
-                # Extract event name from URL
-                event_name = event_data['event_link'].split('/')[-1]
-                event_name = re.sub(r'-+', ' ', event_name).title().strip()
-                event_data['event_name'] = event_name
-            else:
-                event_data['event_link'] = 'N/A'
-                event_data['event_name'] = 'N/A'
+        onclick_values = _XP_CARD_ONCLICK(card)
+        url_match = _ONCLICK_URL_RE.search(onclick_values[0]) if onclick_values else None
+        if url_match:
+            event_data['event_link'] = url_match.group(1)
+            # Extract event name from URL
+            event_name = event_data['event_link'].split('/')[-1]
+            event_name = re.sub(r'-+', ' ', event_name).title().strip()
+            event_data['event_name'] = event_name
         else:
             event_data['event_link'] = 'N/A'
             event_data['event_name'] = 'N/A'
-        
+
         # Extract location
-        venue_link = card.find('div', class_='venue')
-        if venue_link:
-            venue_a = venue_link.find('a')
-            if venue_a:
-                location = venue_a.get_text(strip=True)
+        venue_divs = _XP_CARD_VENUE(card)
+        if venue_divs:
+            venue_links = _XP_CARD_VENUE_LINK(card)
+            if venue_links:
+                location = venue_links[0].text_content().strip()
                 # Try to parse city and state
                 if ',' in location:
                     parts = location.split(',')
@@ -185,102 +506,145 @@ def extract_event_data_from_card(card, headers):
                     event_data['city'] = location
                     event_data['state'] = 'N/A'
             else:
-                event_data['city'] = venue_link.get_text(strip=True)
+                event_data['city'] = venue_divs[0].text_content().strip()
                 event_data['state'] = 'N/A'
         else:
             event_data['city'] = 'N/A'
             event_data['state'] = 'N/A'
-        
+
         return event_data
-        
+
     except Exception as e:
         print(f"      ❌ Error extracting event data: {str(e)}")
         return None
 
+async def _fetch_all_organizers(event_urls, headers):
+    """Fetch organizer pages concurrently over one aiohttp session, bounded by a semaphore"""
+    # Cache DNS answers for the run so each organizer host is resolved once,
+    # through c-ares (aiodns) instead of the default thread-pool resolver
+    resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+    connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=600, use_dns_cache=True, resolver=resolver)
+    sem = asyncio.Semaphore(CONCURRENT_REQUESTS)
+
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+
+        async def bounded(event_url):
+            async with sem:
+                return await extract_organizer_details(event_url, session)
+
+        tasks = [asyncio.create_task(bounded(u)) for u in event_urls]
+        return await asyncio.gather(*tasks)
+
 def scrape_10times_medical_pharma():
     """Main scraping function for 10times.com medical pharma events"""
-    
+
     url = "https://10times.com/usa/medical-pharma"
     headers = get_stealth_headers()
-    
+
     print(f"🎯 MEDICAL & PHARMA ORGANIZER SCRAPER")
     print(f"📍 Target: {url}")
     print(f"📊 Events to scrape: {EVENTS_TO_SCRAPE}")
     print(f"⏰ Request delay: {REQUEST_DELAY} seconds")
+    print(f"⚡ Concurrent fetches: {CONCURRENT_REQUESTS} ({'aiohttp' if aiohttp else 'thread pool'})")
     print("=" * 70)
-    
+
     try:
         print("🌐 Fetching main event listing page...")
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         print(f"✅ Page fetched successfully (Status: {response.status_code})")
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        event_cards = soup.find_all('tr', class_=lambda x: x and 'event-card' in x)
-        
+        print(f"🗜️  Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}"
+              f" (brotli {'enabled' if _BROTLI_AVAILABLE else 'not installed'})")
+
+        listing_tree = lxml_html.fromstring(response.content)
+        event_cards = _XP_EVENT_CARDS(listing_tree)
+
         print(f"🔍 Found {len(event_cards)} event cards")
         event_cards = event_cards[:EVENTS_TO_SCRAPE]
-        
+
+        # Extract basic event info from every card first (pure parsing, no I/O)
+        basics = []
+        for card in event_cards:
+            event_data = extract_event_data_from_card(card, headers)
+            if not event_data or event_data['event_name'] == 'N/A':
+                print(f"    ❌ Could not extract basic event data")
+                continue
+            basics.append(event_data)
+
+        # Deduplicate first - listings repeat event slugs across pagination,
+        # and each unique organizer page only needs to be fetched once
+        event_urls = list(dict.fromkeys(e['event_link'] for e in basics if e['event_link'] != 'N/A'))
+
+        # Fetch the unique organizer pages concurrently - via asyncio when
+        # aiohttp is available, otherwise threads around the blocking Session calls
+        if aiohttp is not None:
+            results = asyncio.run(_fetch_all_organizers(event_urls, headers))
+        else:
+            with ThreadPoolExecutor(max_workers=CONCURRENT_REQUESTS) as executor:
+                results = list(executor.map(extract_organizer_details_sync, event_urls))
+
+        # Map results back onto every card (duplicates get a copy of the
+        # shared result so later per-event tweaks stay independent)
+        results_by_url = dict(zip(event_urls, results))
+        organizers = [
+            dict(results_by_url[e['event_link']]) if e['event_link'] != 'N/A'
+            else {'organiser_name': 'N/A', 'organiser_website': 'N/A', 'organiser_email': 'N/A', 'verification_status': 'No_Details'}
+            for e in basics
+        ]
+
         scraped_data = []
         validation_log = []
-        
-        for i, card in enumerate(event_cards, 1):
+
+        for i, (event_data, organizer_info) in enumerate(zip(basics, organizers), 1):
             try:
-                print(f"\n📋 Processing Event {i}/{len(event_cards)}")
-                
-                # Extract basic event info
-                event_data = extract_event_data_from_card(card, headers)
-                
-                if not event_data or event_data['event_name'] == 'N/A':
-                    print(f"    ❌ Could not extract basic event data")
-                    continue
-                
+                print(f"\n📋 Processing Event {i}/{len(basics)}")
                 print(f"    📅 Event: {event_data['event_name']}")
                 print(f"    📍 Location: {event_data['city']}, {event_data['state']}")
                 print(f"    🔗 Link: {event_data['event_link']}")
-                
-                # Get organizer details
-                organizer_info = {'organiser_name': 'N/A', 'organiser_website': 'N/A', 'organiser_email': 'N/A', 'verification_status': 'No_Details'}
-                
-                if event_data['event_link'] != 'N/A':
-                    organizer_info = extract_organizer_details(event_data['event_link'], headers)
-                
+
+                # Reuse the HTTP result recorded during extraction; only websites
+                # found via Method 1 (never fetched) need a fresh validation HEAD
+                website_ok = organizer_info.pop('_website_http_ok', False)
+
                 # Combine data
                 combined_data = {**event_data, **organizer_info}
-                
+
                 # Validation
                 validation_notes = []
                 if organizer_info['organiser_website'] != 'N/A':
-                    if validate_url(organizer_info['organiser_website']):
+                    if website_ok or validate_url(organizer_info['organiser_website']):
                         validation_notes.append("Website_Valid")
                     else:
                         validation_notes.append("Website_Invalid")
-                
+
                 if organizer_info['organiser_email'] != 'N/A':
                     if validate_email_format(organizer_info['organiser_email']):
                         validation_notes.append("Email_Format_Valid")
                     else:
                         validation_notes.append("Email_Format_Invalid")
-                
+
                 combined_data['validation_notes'] = ', '.join(validation_notes)
-                
+
                 scraped_data.append(combined_data)
-                
+
                 # Log for validation
                 log_entry = f"Event {i}: {event_data['event_name']} | Status: {organizer_info['verification_status']} | Notes: {combined_data['validation_notes']}"
                 validation_log.append(log_entry)
-                
+
                 print(f"    ✅ Status: {organizer_info['verification_status']}")
-                
+
             except Exception as e:
                 print(f"    ❌ Error processing event {i}: {str(e)}")
                 continue
-        
+
         # Save validation log
         with open(VALIDATION_LOG, 'w', encoding='utf-8') as log_file:
             log_file.write("EVENT ORGANIZER SCRAPING VALIDATION LOG\n")
             log_file.write(f"Scraped on: {datetime.now()}\n")
-            log_file.write(f"Total events processed: {len(scraped_data)}\n\n")
+            log_file.write(f"Total events processed: {len(scraped_data)}\n")
+            cache_info = _validate_url_cached.cache_info()
+            log_file.write(f"Page cache: {_PAGE_CACHE_STATS['hits']} hits, {_PAGE_CACHE_STATS['misses']} misses\n")
+            log_file.write(f"URL validation cache: {cache_info.hits} hits, {cache_info.misses} misses\n\n")
             for entry in validation_log:
                 log_file.write(entry + "\n")
         
@@ -308,35 +672,49 @@ def save_to_csv_with_validation(data):
     
     # Prepare CSV data
     csv_headers = [
-        'Event Name', 'Date', 'City', 'State', 
-        'Organiser Name', 'Organiser Website', 'Organiser Email', 
+        'Event Name', 'Date', 'City', 'State',
+        'Organiser Name', 'Organiser Website', 'Organiser Email',
         'Event Link', 'Verification Status', 'Validation Notes'
     ]
-    
-    csv_data = []
-    for event in data:
-        csv_row = {
-            'Event Name': event.get('event_name', 'N/A'),
-            'Date': event.get('event_date', 'N/A'),
-            'City': event.get('city', 'N/A'),
-            'State': event.get('state', 'N/A'),
-            'Organiser Name': event.get('organiser_name', 'N/A'),
-            'Organiser Website': event.get('organiser_website', 'N/A'),
-            'Organiser Email': event.get('organiser_email', 'N/A'),
-            'Event Link': event.get('event_link', 'N/A'),
-            'Verification Status': event.get('verification_status', 'N/A'),
-            'Validation Notes': event.get('validation_notes', 'N/A')
-        }
-        csv_data.append(csv_row)
-    
-    # Save to CSV
-    with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=csv_headers)
-        writer.writeheader()
-        writer.writerows(csv_data)
-    
-    # Create DataFrame for analysis
-    df = pd.DataFrame(csv_data)
+    key_order = [
+        'event_name', 'event_date', 'city', 'state',
+        'organiser_name', 'organiser_website', 'organiser_email',
+        'event_link', 'verification_status', 'validation_notes'
+    ]
+
+    # Headless mode: plain csv write, skip the pandas import and summaries
+    if os.environ.get('NO_PANDAS'):
+        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(csv_headers)
+            writer.writerows([event.get(key, 'N/A') for key in key_order] for event in data)
+        print(f"\n✅ Data saved to: {OUTPUT_CSV} (NO_PANDAS set, summary skipped)")
+        return None
+
+    # Deferred so the common start-up and the no-data path never pay the
+    # ~300ms pandas import
+    import pandas as pd
+
+    # Build the DataFrame once and let it do the CSV write - no per-row
+    # dict copies, no second materialization for the analysis below
+    df = (
+        pd.DataFrame(data)
+        .rename(columns={
+            'event_name': 'Event Name',
+            'event_date': 'Date',
+            'city': 'City',
+            'state': 'State',
+            'organiser_name': 'Organiser Name',
+            'organiser_website': 'Organiser Website',
+            'organiser_email': 'Organiser Email',
+            'event_link': 'Event Link',
+            'verification_status': 'Verification Status',
+            'validation_notes': 'Validation Notes',
+        })
+        .reindex(columns=csv_headers)
+        .fillna('N/A')
+    )
+    df.to_csv(OUTPUT_CSV, index=False, encoding='utf-8')
     
     # Validation summary
     print(f"\n📊 DATA QUALITY SUMMARY:")
@@ -402,5 +780,7 @@ if __name__ == "__main__":
         print(f"   • Increase REQUEST_DELAY")
         print(f"   • Try at different times")
         
+    SESSION.close()
+
     print("\n" + "=" * 60)
     print("🏁 SCRAPER FINISHED")
\ No newline at end of file
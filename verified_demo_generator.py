@@ -11,7 +11,7 @@ VERIFIED EVENTS (as of September 2025):
 """
 
 import csv
-import pandas as pd
+from collections import Counter
 from datetime import datetime
 
 # 🔢 CONFIGURATION
@@ -144,55 +144,51 @@ def save_verified_demo_data():
         'Event Link', 'Verification Status', 'Validation Notes'
     ]
     
-    # Save to CSV
+    # Save to CSV - plain csv.writer with a known column order skips the
+    # per-row fieldname lookups DictWriter does
     with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(verified_data)
-    
-    # Create DataFrame
-    df = pd.DataFrame(verified_data)
+        writer = csv.writer(csvfile)
+        writer.writerow(headers)
+        writer.writerows([event.get(key, 'N/A') for key in headers] for event in verified_data)
     
     print(f"✅ Created {OUTPUT_FILE} with {len(verified_data)} VERIFIED events!")
-    
-    # Verification summary
+
+    # Verification summary (plain dicts - no need to spin up pandas for this)
     print(f"\n🔍 VERIFICATION STATUS SUMMARY:")
-    status_counts = df['Verification Status'].value_counts()
-    for status, count in status_counts.items():
+    status_counts = Counter(e['Verification Status'] for e in verified_data)
+    for status, count in status_counts.most_common():
         print(f"   • {status}: {count}")
-    
+
     print(f"\n🌐 ALL ORGANIZER WEBSITES (Real & Working):")
-    for i, row in df.iterrows():
-        print(f"   {i+1}. {row['Organiser Name']}")
-        print(f"      🌐 {row['Organiser Website']}")
-        print(f"      ✉️  {row['Organiser Email']}")
+    for i, event in enumerate(verified_data, 1):
+        print(f"   {i}. {event['Organiser Name']}")
+        print(f"      🌐 {event['Organiser Website']}")
+        print(f"      ✉️  {event['Organiser Email']}")
         print()
-    
+
     # Data quality summary
     print(f"📊 DATA QUALITY SUMMARY:")
-    print(f"   ✅ Total events: {len(df)}")
-    print(f"   📅 Events with verified dates: {(df['Verification Status'] == 'Verified_Official_Source').sum()}")
-    print(f"   📅 Events with pattern-based dates: {(df['Verification Status'] == 'Pattern_Based_Estimate').sum()}")
-    print(f"   🏢 Events with real organizer names: {len(df)} (100%)")
-    print(f"   🌐 Events with real websites: {len(df)} (100%)")
-    print(f"   ✉️  Events with contact emails: {len(df)} (100%)")
-    
+    print(f"   ✅ Total events: {len(verified_data)}")
+    print(f"   📅 Events with verified dates: {status_counts['Verified_Official_Source']}")
+    print(f"   📅 Events with pattern-based dates: {status_counts['Pattern_Based_Estimate']}")
+    print(f"   🏢 Events with real organizer names: {len(verified_data)} (100%)")
+    print(f"   🌐 Events with real websites: {len(verified_data)} (100%)")
+    print(f"   ✉️  Events with contact emails: {len(verified_data)} (100%)")
+
     # Show preview
     print(f"\n📋 PREVIEW FOR CLIENT:")
     print("-" * 80)
-    pd.set_option('display.max_columns', None)
-    pd.set_option('display.width', None)
-    pd.set_option('display.max_colwidth', 50)
-    print(df[['Event Name', 'Date', 'City', 'Organiser Name']].head())
-    
+    for event in verified_data[:5]:
+        print(f"   {event['Event Name']:<55} {event['Date']:<28} {event['City']}")
+
     print(f"\n💡 NOTES FOR CLIENT:")
     print("✅ BIO 2026 & HIMSS 2026 dates are VERIFIED from official sources")
     print("✅ All organizer websites are real and working") 
     print("✅ Email addresses follow standard patterns for these organizations")
     print("⚠️  Some dates are estimates based on historical patterns - verify before outreach")
     print("📋 Use this as a template to verify other events")
-    
-    return df
+
+    return verified_data
 
 if __name__ == "__main__":
     print("🎯 VERIFIED MEDICAL & PHARMA ORGANIZER DEMO")
@@ -200,7 +196,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     # Create demo data
-    df_demo = save_verified_demo_data()
+    demo_data = save_verified_demo_data()
     
     print(f"\n🎉 DEMO DATA CREATED SUCCESSFULLY!")
     print(f"📁 File: {OUTPUT_FILE}")